@@ -1,4 +1,5 @@
-from typing import Any, List, Optional
+from datetime import date
+from typing import Any, List, Optional, Union
 from wildlife_tracker.animal_management.animal import Animal
 from wildlife_tracker.habitat_management.habitat import Habitat
 from wildlife_tracker.migration_tracking.migration import Migration
@@ -9,7 +10,7 @@ age: Optional[int] = None
 animal_id: int
 animals: dict[int, Animal] = {}
 animals: List[int] = []
-current_date: str
+current_date: date
 current_location: str
 destination: Habitat
 duration: Optional[int] = None
@@ -26,7 +27,7 @@ paths: dict[int, MigrationPath] = {}
 size: int
 species: str
 species: str
-start_date: str
+start_date: date
 start_location: Habitat
 status: str = "Scheduled"
 
@@ -132,7 +133,7 @@ def get_migrations_by_migration_path(migration_path_id: int) -> list[Migration]:
     pass
 
 
-def get_migrations_by_start_date(start_date: str) -> list[Migration]:
+def get_migrations_by_start_date(start_date: Union[str, date]) -> list[Migration]:
     pass
 
 
@@ -1,32 +1,62 @@
-from typing import Any, Optional
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from typing import Any, Optional, Union
 from wildlife_tracker.habitat_management.habitat import Habitat
 
 
+def _to_date(value: Union[str, date]) -> date:
+    # datetime is a date subclass, so it has to be narrowed before the date check
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    raise TypeError(
+        f"Expected an ISO date string or date, got {type(value).__name__}"
+    )
+
+
+@dataclass(slots=True, eq=False)
 class Migration:
-    def __init__(
-        self,
-        migration_id: int,
-        path_id: int,
-        start_location: Habitat,
-        current_location: str,
-        start_date: str,
-        current_date: str,
-        destination: Habitat,
-        duration: Optional[int] = None,
-        status: str = "Scheduled",
-    ) -> None:
-        self.migration_id = migration_id
-        self.path_id = path_id
-        self.start_location = start_location
-        self.current_location = current_location
-        self.start_date = start_date
-        self.current_date = current_date
-        self.destination = destination
-        self.duration = duration
-        self.status = status
+    migration_id: int
+    path_id: int
+    start_location: Habitat
+    current_location: str
+    # ISO strings are also accepted here and parsed once in __post_init__
+    start_date: date
+    current_date: date
+    destination: Habitat
+    duration: Optional[int] = None
+    status: str = "Scheduled"
+
+    def __post_init__(self) -> None:
+        self.start_date = _to_date(self.start_date)
+        self.current_date = _to_date(self.current_date)
+
+    @property
+    def elapsed_days(self) -> int:
+        # negative while a scheduled migration has not started yet
+        return (self.current_date - self.start_date).days
+
+    @property
+    def start_date_str(self) -> str:
+        return self.start_date.isoformat()
+
+    @property
+    def current_date_str(self) -> str:
+        return self.current_date.isoformat()
 
     def get_migration_details(self) -> dict[str, Any]:
-        pass
+        # shallow on purpose: dataclasses.asdict would deep-copy the habitats
+        return {f.name: getattr(self, f.name) for f in fields(self)}
 
     def update_migration_details(self, **kwargs: Any) -> None:
-        pass
+        for key in kwargs:
+            if key not in self.__slots__:
+                raise AttributeError(f"Migration has no attribute '{key}'")
+        for key in ("start_date", "current_date"):
+            if key in kwargs:
+                kwargs[key] = _to_date(kwargs[key])
+        for key, value in kwargs.items():
+            setattr(self, key, value)
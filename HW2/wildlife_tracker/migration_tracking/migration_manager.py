@@ -1,4 +1,5 @@
-from typing import Optional, List, Any
+from datetime import date
+from typing import Optional, List, Any, Union
 from wildlife_tracker.migration_tracking.migration import Migration
 from wildlife_tracker.migration_tracking.migration_path import MigrationPath
 from wildlife_tracker.habitat_management.habitat import Habitat
@@ -63,7 +64,9 @@ class MigrationManager:
     ) -> List[Migration]:
         pass
 
-    def get_migrations_by_start_date(self, start_date: str) -> List[Migration]:
+    def get_migrations_by_start_date(
+        self, start_date: Union[str, date]
+    ) -> List[Migration]:
         pass
 
     def get_migrations_by_status(self, status: str) -> List[Migration]: